@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 import time
@@ -5,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import lxml.html
 import rapidfuzz
+from lxml import etree
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -62,9 +64,6 @@ SEASON_DROPDOWN_XPATH = (
     "//*[contains(@class, 'dropdown__button') and starts-with(normalize-space(), 'Season ')]"
 )
 ITEM_GROUP_XPATH = ".//*[contains(@class, 'builder__stats__group')]"
-ITEM_SLOT_XPATH = ".//*[contains(@class, 'builder__stats__slot')]"
-ITEM_STATS_XPATH = ".//*[contains(@class, 'dropdown__button__wrapper')]"
-GA_XPATH = ".//*[contains(@class, 'greater__affix__button--filled')]"
 PAPERDOLL_ITEM_SLOT_XPATH = ".//*[contains(@class, 'builder__gear__slot')]"
 PAPERDOLL_ITEM_UNIQUE_NAME_XPATH = ".//*[contains(@class, 'builder__gear__name--')]"
 PAPERDOLL_ITEM_XPATH = ".//*[contains(@class, 'builder__gear__item') and not(contains(@class, 'disabled'))]"
@@ -72,8 +71,6 @@ PAPERDOLL_LEGENDARY_ASPECT_XPATH = (
     "//*[@class='builder__gear__name' and not(contains(@class, 'builder__gear__name--'))]"
 )
 PAPERDOLL_XPATH = "//*[contains(@class, 'builder__gear__items')]"
-TEMPERING_ICON_XPATH = ".//*[contains(@src, 'tempering_02.png')]"
-SANCTIFIED_ICON_XPATH = ".//*[contains(@src, 'sanctified_icon.png')]"
 UNIQUE_ICON_XPATH = ".//*[contains(@src, '/Uniques/')]"
 ACTIVE_SEAL_CSS = ".builder__seal.active"
 ACTIVE_CHARM_CSS = ".builder__charm.active"
@@ -86,6 +83,31 @@ CHARM_TOOLTIP_VALUE_XPATH = (
 )
 CHARM_TOOLTIP_SET_NAME_XPATH = ".//*[contains(@class, 'charm__tooltip__set__name')]"
 
+_DIGIT_RE = re.compile(r"\d+")
+# Parsing bytes skips lxml's re-encode of the page_source str; we never look up ids or comments
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+# Everything the importer reads lives in these three subtrees; serializing only them keeps the
+# WebDriver payload and the lxml parse far smaller than a full page_source round trip
+_PAGE_FRAGMENTS_JS = (
+    "return ['.builder__header', '.builder__stats__list', '.builder__gear']"
+    ".map((sel) => { const node = document.querySelector(sel); return node ? node.outerHTML : ''; })"
+    ".join('');"
+)
+_OFFHAND_TYPE_WORDS = ("focus", "offhand", "shield", "totem")  # special lines indicating the item type
+# Filters tempered/sanctified/unfilled stat rows inside libxml2 instead of with three xpath trips per row
+_FILLED_STATS_XPATH = etree.XPath(
+    ".//*[contains(@class, 'dropdown__button__wrapper')"
+    " and contains(../../@class, 'filled')"
+    " and not(.//*[contains(@src, 'tempering_02.png')])"
+    " and not(.//*[contains(@src, 'sanctified_icon.png')])]"
+)
+_GA_ANCESTOR_XPATH = etree.XPath("ancestor::*[4]//*[contains(@class, 'greater__affix__button--filled')]")
+_ITEM_STATS_XPATH = etree.XPath(".//*[contains(@class, 'dropdown__button__wrapper')]")
+# Returns the slot label (the tail text of the second slot node) as a plain string, or "" when absent
+_SLOT_TAIL_XPATH = etree.XPath(
+    "string((.//*[contains(@class, 'builder__stats__slot')])[2]/following-sibling::text()[1])"
+)
+
 
 class D4BuildsError(Exception):
     pass
@@ -100,12 +122,18 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
     LOGGER.info(f"Loading {url}")
     driver.get(url)
     wait = WebDriverWait(driver, 10)
-    wait.until(ec.presence_of_element_located((By.XPATH, BUILD_OVERVIEW_XPATH)))
-    wait.until(ec.presence_of_element_located((By.XPATH, PAPERDOLL_XPATH)))
+    # One JS round trip per poll instead of two separate presence waits
+    wait.until(
+        lambda d: d.execute_script(
+            "return document.querySelector('.builder__stats__list') !== null"
+            " && document.querySelector('.builder__gear__items') !== null"
+        )
+    )
     time.sleep(
         5
     )  # super hacky but I didn't find anything else. The page is not fully loaded when the above wait is done
-    data = lxml.html.fromstring(driver.page_source)
+    page_html = driver.execute_script(_PAGE_FRAGMENTS_JS) or driver.page_source
+    data = lxml.html.fromstring(f"<div>{page_html}</div>".encode("utf-8", "replace"), parser=_HTML_PARSER)
     class_name, build_header, season_number, variant_name = _extract_build_metadata(data=data)
     build_name = build_header or class_name
     if not (items := data.xpath(BUILD_OVERVIEW_XPATH)):
@@ -118,15 +146,15 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
     aspect_upgrade_filters = _get_legendary_aspects(data=data)
     for item in items[0]:
         item_filter = ItemFilterModel()
-        if not (slot := item.xpath(ITEM_SLOT_XPATH)[1].tail):
+        if not (slot := _SLOT_TAIL_XPATH(item)):
             LOGGER.error("No item_type found")
             continue
         if slot not in slot_to_unique_name_map:
             LOGGER.warning(f"Empty slots are not supported. Skipping: {slot}")
             continue
 
-        stats = item.xpath(ITEM_STATS_XPATH)
-        if not stats:
+        stats = _FILLED_STATS_XPATH(item)
+        if not stats and not _ITEM_STATS_XPATH(item):
             LOGGER.error(f"No stats found for {slot=}")
             continue
 
@@ -147,13 +175,10 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
                     f"Unexpected error adding unique aspect for {unique_name}, please report a bug and include a link to the build you were trying to import."
                 )
 
-        is_weapon = "weapon" in slot.lower()
-        affix_dict = affix_dict_for_item_type(item_type=item_type)
+        slot_lower = slot.lower()
+        is_weapon = "weapon" in slot_lower
+        is_offhand = "offhand" in slot_lower
         for stat in stats:
-            if stat.xpath(TEMPERING_ICON_XPATH) or stat.xpath(SANCTIFIED_ICON_XPATH):
-                continue
-            if "filled" not in stat.xpath("../..")[0].attrib["class"]:
-                continue
             affix_name = _get_affix_name(stat)
             if not affix_name:
                 LOGGER.warning(f"Slot {slot} is missing an affix, skipping import of that affix.")
@@ -161,25 +186,21 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
             if is_weapon and (x := fix_weapon_type(input_str=affix_name)) is not None:
                 item_type = x
                 continue
-            if (
-                "offhand" in slot.lower()
-                and (x := fix_offhand_type(input_str=affix_name, class_str=class_name)) is not None
-            ):
+            if is_offhand and (x := fix_offhand_type(input_str=affix_name, class_str=class_name)) is not None:
                 item_type = x
-                if any(
-                    substring in affix_name.lower() for substring in ["focus", "offhand", "shield", "totem"]
-                ):  # special line indicating the item type
+                affix_name_lower = affix_name.lower()
+                if any(substring in affix_name_lower for substring in _OFFHAND_TYPE_WORDS):
                     continue
-            affix_obj = Affix(name=closest_match(clean_str(_corrections(input_str=affix_name)), affix_dict))
+            affix_obj = Affix(name=_resolve_affix(affix_name))
             if affix_obj.name is None:
                 LOGGER.error(f"Couldn't match {affix_name=}")
                 continue
-            if config.import_greater_affixes and stat.xpath("../../../..")[0].xpath(GA_XPATH):
+            if config.import_greater_affixes and _GA_ANCESTOR_XPATH(stat):
                 affix_obj.type = AffixType.greater
             affixes.append(affix_obj)
 
         item_type = (
-            match_to_enum(enum_class=ItemType, target_string=re.sub(r"\d+", "", slot.replace(" ", "")))
+            match_to_enum(enum_class=ItemType, target_string=_DIGIT_RE.sub("", slot.replace(" ", "")))
             if item_type is None
             else item_type
         )
@@ -201,17 +222,18 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
 
         # We don't bother importing affixes for mythics
         if rarity != ItemRarity.Mythic:
+            # The names come straight out of the affix dict, so skip re-validating each model
+            affix_models = [
+                AffixFilterModel.model_construct(name=x.name, want_greater=x.type == AffixType.greater)
+                for x in affixes
+            ]
             item_filter.affix_pool = [
-                AffixFilterCountModel(
-                    count=[AffixFilterModel(name=x.name, want_greater=x.type == AffixType.greater) for x in affixes],
-                    minCount=1 if rarity == ItemRarity.Unique else 3,
-                )
+                AffixFilterCountModel(count=affix_models, minCount=1 if rarity == ItemRarity.Unique else 3)
             ]
             update_mingreateraffixcount(item_filter, config.require_greater_affixes)
             if inherents:
-                item_filter.inherent_pool = [
-                    AffixFilterCountModel(count=[AffixFilterModel(name=x.name) for x in inherents])
-                ]
+                inherent_models = [AffixFilterModel.model_construct(name=x.name) for x in inherents]
+                item_filter.inherent_pool = [AffixFilterCountModel(count=inherent_models)]
         item_filter.min_power = 100
         finished_filters.append(item_filter)
     # Place all mythics in a single filter
@@ -255,14 +277,23 @@ def import_d4builds(config: ImportConfig, driver: ChromiumDriver = None):
     LOGGER.info("Finished")
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve_affix(affix_name: str) -> str | None:
+    """Resolution only depends on the affix name, so repeated names across slots skip the fuzzy match."""
+    return closest_match(clean_str(_corrections(input_str=affix_name)), Dataloader().affix_dict)
+
+
+_AFFIX_NAME_CORRECTIONS = {
+    "max life": "maximum life",
+    "total armor": "armor",
+}
+
+
 def _corrections(input_str: str) -> str:
     input_str = input_str.lower()
-    match input_str:
-        case "max life":
-            return "maximum life"
-        case "total armor":
-            return "armor"
-    if "ranks to" in input_str or "ranks of" in input_str or "ranks" in input_str:
+    if (corrected := _AFFIX_NAME_CORRECTIONS.get(input_str)) is not None:
+        return corrected
+    if "ranks" in input_str:  # also covers "ranks to" / "ranks of"
         return input_str.replace("ranks to", "to").replace("ranks of", "to").replace("ranks", "to")
     if "charm slot" in input_str:
         return "charm slot"
@@ -478,8 +509,8 @@ def _get_item_slots(data: lxml.html.HtmlElement) -> dict[str, tuple[str, ItemRar
         LOGGER.error(msg := "No items found")
         raise D4BuildsError(msg)
     for item in items:
-        if item.xpath(PAPERDOLL_ITEM_SLOT_XPATH):
-            slot = item.xpath(PAPERDOLL_ITEM_SLOT_XPATH)[0].text
+        if slot_nodes := item.xpath(PAPERDOLL_ITEM_SLOT_XPATH):
+            slot = slot_nodes[0].text
             if slot == "2H Weapon":  # This happens when a build has a weapon and no offhand
                 slot = "Weapon"
             unique_name_elem = item.xpath(PAPERDOLL_ITEM_UNIQUE_NAME_XPATH)
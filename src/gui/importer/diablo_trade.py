@@ -1,11 +1,15 @@
+import concurrent.futures
 import dataclasses
 import datetime
+import functools
 import json
 import logging
+import operator
 import pathlib
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+import httpx
 import lxml.html
 from pydantic import ValidationError
 
@@ -14,18 +18,24 @@ from src.config.loader import IniConfigLoader
 from src.config.profile_document import ProfileDocumentStore
 from src.config.profile_models import AffixFilterCountModel, AffixFilterModel, ItemFilterModel, ProfileModel
 from src.dataloader import Dataloader
-from src.gui.importer.gui_common import format_number_as_short_string, match_to_enum, retry_importer
+from src.gui.importer.gui_common import format_number_as_short_string, load_json, match_to_enum, retry_importer
 from src.item.data.affix import Affix
 from src.item.data.item_type import ItemType
 from src.item.data.rarity import ItemRarity
 from src.item.descr.text import clean_str, closest_match
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import seleniumbase
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.propagate = True
 BASE_URL = "diablo.trade/listings/"
+API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+}
 
 
 @dataclasses.dataclass
@@ -35,6 +45,14 @@ class _AnnotatedFilter:
     min_price: int | None = None
 
 
+@dataclasses.dataclass
+class _FilterBucket:
+    representative: "_Listing"
+    min_price: int
+    max_price: int
+    min_value_by_affix: dict[str, float]
+
+
 @dataclasses.dataclass
 class _Listing:
     affixes: list[Affix] | None = None
@@ -43,7 +61,6 @@ class _Listing:
     item_rarity: ItemRarity | None = None
     item_type: ItemType | None = None
     price: int = 0
-    raw_data: dict[str, Any] | None = None
 
 
 class DiabloTradeError(Exception):
@@ -57,14 +74,40 @@ def import_diablo_trade(url: str, max_listings: int, driver: seleniumbase.Driver
         LOGGER.error("Invalid url, please use a diablo.trade filter url")
         return
     LOGGER.info("Start fetching listings")
+    client = httpx.Client(headers=API_HEADERS)
+    use_driver = False
+
+    build_api_url = _make_api_url_builder(listing_url=url)
+
+    def fetch_page_data(cursor: int) -> dict:
+        nonlocal use_driver
+        api_url = build_api_url(cursor)
+        if not use_driver:
+            # The search endpoint serves plain JSON, so a direct request on a kept-alive
+            # connection beats a full browser navigation by orders of magnitude.
+            try:
+                r = client.get(api_url)
+                if r.status_code == 200:
+                    return load_json(r.content)
+                LOGGER.debug(f"Direct API request failed with status code {r.status_code}, using the browser instead")
+            except httpx.RequestError:
+                LOGGER.debug("Direct API request failed, using the browser instead")
+            # Most likely a Cloudflare challenge; stick with the browser for the rest of the run
+            use_driver = True
+        driver.default_get(url=api_url)
+        source = lxml.html.fromstring(driver.get_page_source())
+        return load_json(source.text_content().strip())
+
     all_listings = []
     cursor = 1
+    # A single worker pipelines the (slow) page fetch for the next cursor while the main
+    # thread parses the current one; the driver is only ever used by the worker between results.
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    next_page = executor.submit(fetch_page_data, cursor)
     while True:
-        api_url = _construct_api_url(listing_url=url, cursor=cursor)
         try:
-            driver.default_get(url=api_url)
-            source = lxml.html.fromstring(driver.get_page_source())
-            data = json.loads(source.text_content().strip())
+            data = next_page.result()
+            next_page = executor.submit(fetch_page_data, cursor + 1)
         except Exception:
             LOGGER.exception("Can't fetch listings, saving current data")
             break
@@ -90,7 +133,6 @@ def import_diablo_trade(url: str, max_listings: int, driver: seleniumbase.Driver
                 item_rarity=ItemRarity.Legendary,
                 item_type=item_type,
                 price=listing["price"],
-                raw_data=listing,
             )
             try:
                 assert listing_obj.item_type is not None
@@ -103,6 +145,9 @@ def import_diablo_trade(url: str, max_listings: int, driver: seleniumbase.Driver
         if len(all_listings) >= max_listings:
             break
         cursor += 1
+    next_page.cancel()
+    executor.shutdown(wait=True)
+    client.close()
 
     try:
         profile = ProfileModel(name="diablo_trade", Affixes=_create_filters_from_items(items=all_listings))
@@ -112,7 +157,7 @@ def import_diablo_trade(url: str, max_listings: int, driver: seleniumbase.Driver
             IniConfigLoader().user_dir
             / f"diablo_trade_dump_{datetime.datetime.now(tz=datetime.UTC).strftime('%Y_%m_%d_%H_%M_%S')}.json"
         ).open("w", encoding="utf-8") as f:
-            json.dump(all_listings, f, indent=4, sort_keys=True)
+            json.dump([dataclasses.asdict(x) for x in all_listings], f, indent=4, sort_keys=True, default=str)
         raise DiabloTradeError(msg) from exc
 
     LOGGER.info(f"Saving profile with {len(profile.affixes)} filters")
@@ -124,25 +169,48 @@ def import_diablo_trade(url: str, max_listings: int, driver: seleniumbase.Driver
     LOGGER.info("Finished")
 
 
-def _construct_api_url(listing_url: str, cursor: int = 1) -> str:
+def _make_api_url_builder(listing_url: str) -> Callable[[int], str]:
+    """Parse the listing url once; only the cursor value changes between pages."""
     parsed_url = urlparse(listing_url)
     query_dict = parse_qs(parsed_url.query)
-    query_dict["cursor"] = [str(cursor)]
-    new_query_string = urlencode(query_dict, doseq=True)
-    return urlunparse((
-        parsed_url.scheme,
-        parsed_url.netloc,
-        "api/items/search",
-        parsed_url.params,
-        new_query_string,
-        parsed_url.fragment,
-    ))
+    query_dict.pop("cursor", None)
+    base_query = urlencode(query_dict, doseq=True)
+
+    def build_api_url(cursor: int) -> str:
+        cursor_query = f"{base_query}&cursor={cursor}" if base_query else f"cursor={cursor}"
+        return urlunparse((
+            parsed_url.scheme,
+            parsed_url.netloc,
+            "api/items/search",
+            parsed_url.params,
+            cursor_query,
+            parsed_url.fragment,
+        ))
+
+    return build_api_url
+
+
+@functools.lru_cache(maxsize=1)
+def _exact_affix_names() -> dict[str, str]:
+    """Reverse map from display name to affix key; first key wins, like closest_match on a tie."""
+    exact: dict[str, str] = {}
+    for key, name in Dataloader().affix_dict.items():
+        exact.setdefault(name, key)
+    return exact
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_affix_name(cleaned: str) -> str | None:
+    """Listings repeat the same affix names constantly; cache the fuzzy match per cleaned string."""
+    if (exact := _exact_affix_names().get(cleaned)) is not None:
+        return exact
+    return closest_match(cleaned, Dataloader().affix_dict)
 
 
 def _create_affixes_from_api_dict(affixes: list[dict[str, Any]]) -> list[Affix]:
     res = []
     for affix in affixes:
-        new_affix = Affix(name=closest_match(clean_str(affix["name"]), Dataloader().affix_dict), value=affix["value"])
+        new_affix = Affix(name=_resolve_affix_name(clean_str(affix["name"])), value=affix["value"])
         if isinstance(new_affix.value, list):
             if new_affix.value:
                 new_affix.value = new_affix.value[0]
@@ -155,61 +223,85 @@ def _create_affixes_from_api_dict(affixes: list[dict[str, Any]]) -> list[Affix]:
 
 
 def _create_filters_from_items(items: list[_Listing]) -> list[dict[str, ItemFilterModel]]:
-    to_check = items.copy()
-    result = []
-    for item in items.copy():
-        if item not in to_check:
+    # Group identical listings (same item type and affix-name set) in one linear pass; the
+    # pairwise superset merge below then only runs over the much smaller set of bucket
+    # representatives instead of every listing.
+    buckets: dict[tuple[ItemType, frozenset[str]], _FilterBucket] = {}
+    for item in items:
+        key = (item.item_type, frozenset(x.name for x in item.affixes))
+        if (bucket := buckets.get(key)) is None:
+            buckets[key] = _FilterBucket(
+                representative=item,
+                min_price=item.price,
+                max_price=item.price,
+                min_value_by_affix={x.name: x.value for x in item.affixes},
+            )
+        else:
+            bucket.min_price = min(bucket.min_price, item.price)
+            bucket.max_price = max(bucket.max_price, item.price)
+            min_values = bucket.min_value_by_affix
+            for x in item.affixes:
+                if x.value < min_values[x.name]:
+                    min_values[x.name] = x.value
+
+    # Fold bucket B into an earlier bucket A when A's affix names are a subset of B's, matching
+    # the old behavior where a listing was absorbed by the first filter it satisfied.
+    result: list[_AnnotatedFilter] = []
+    merged: list[tuple[_AnnotatedFilter, frozenset[str]]] = []
+    for (item_type, affix_names), bucket in buckets.items():
+        absorbed = False
+        for existing_filter, existing_names in merged:
+            if item_type in existing_filter.filter.item_type and existing_names <= affix_names:
+                existing_filter.min_price = min(existing_filter.min_price, bucket.min_price)
+                existing_filter.max_price = max(existing_filter.max_price, bucket.max_price)
+                for x in existing_filter.filter.affix_pool[0].count:
+                    value = bucket.min_value_by_affix.get(x.name)
+                    if value is not None and value < x.value:
+                        x.value = value
+                absorbed = True
+                break
+        if absorbed:
             continue
-        to_check.remove(item)
         try:
             annotated_filter = _AnnotatedFilter(
-                max_price=item.price,
-                min_price=item.price,
+                max_price=bucket.max_price,
+                min_price=bucket.min_price,
                 filter=ItemFilterModel(
-                    min_power=item.item_power,
-                    item_type=[item.item_type],
+                    min_power=bucket.representative.item_power,
+                    item_type=[item_type],
                     affix_pool=[
                         AffixFilterCountModel(
-                            count=[AffixFilterModel(name=x.name, value=x.value) for x in item.affixes]
+                            count=[
+                                AffixFilterModel(name=x.name, value=bucket.min_value_by_affix[x.name])
+                                for x in bucket.representative.affixes
+                            ]
                         )
                     ],
                 ),
             )
         except ValidationError:
-            LOGGER.exception(f"Failed validation. Skipping {item=}")
+            LOGGER.exception(f"Failed validation. Skipping {bucket.representative=}")
             continue
-        to_delete = []
-        for to_check_item in [x for x in to_check if x.item_type in annotated_filter.filter.item_type]:
-            annotated_filter_affixes = [(x.name, x.value) for x in annotated_filter.filter.affix_pool[0].count]
-            to_check_item_affixes = [(x.name, x.value) for x in to_check_item.affixes]
-            for x in annotated_filter_affixes:
-                if not any(a[0] == x[0] for a in to_check_item_affixes):
-                    break
-            else:
-                to_delete.append(to_check_item)
-                annotated_filter.min_price = min(annotated_filter.min_price, to_check_item.price)
-                annotated_filter.max_price = max(annotated_filter.max_price, to_check_item.price)
-                for x in annotated_filter.filter.affix_pool[0].count:
-                    for y in [a for a in to_check_item.affixes if x.name == a.name]:
-                        x.value = min(x.value, y.value)
-        for to_delete_item in to_delete:
-            to_check.remove(to_delete_item)
+        merged.append((annotated_filter, affix_names))
         result.append(annotated_filter)
-    converted_result = []
+    converted_result: list[tuple[str, ItemFilterModel]] = []
+    used_names: set[str] = set()
     for annotated_filter in result:
         name = (
             f"{annotated_filter.filter.item_type[0].value}_{format_number_as_short_string(annotated_filter.min_price)}"
         )
         if annotated_filter.min_price != annotated_filter.max_price:
             name += f"_{format_number_as_short_string(annotated_filter.max_price)}"
-        # if there is a dict with this key name already in the list, append a number to the key name using change_key_of_dict
+        # if there is a dict with this key name already in the list, append a number to the key name
         suffixed_name = name
         i = 2
-        while any(suffixed_name in x for x in converted_result):
+        while suffixed_name in used_names:
             suffixed_name = f"{name}_{i}"
             i += 1
-        converted_result.append({suffixed_name: annotated_filter.filter})
-    return sorted(converted_result, key=lambda x: next(iter(x)))
+        used_names.add(suffixed_name)
+        converted_result.append((suffixed_name, annotated_filter.filter))
+    converted_result.sort(key=operator.itemgetter(0))
+    return [{name: item_filter} for name, item_filter in converted_result]
 
 
 if __name__ == "__main__":
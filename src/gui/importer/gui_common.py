@@ -1,3 +1,5 @@
+import atexit
+import contextlib
 import functools
 import logging
 import re
@@ -6,7 +8,7 @@ from typing import TYPE_CHECKING, Literal, TypeVar
 
 import httpx
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
@@ -28,6 +30,12 @@ from src.gui.importer.importer_config import DEFAULT_FILENAME_PARTS, FilenamePar
 from src.item.data.affix import Affix, AffixType
 from src.item.data.item_type import ItemType
 
+try:
+    # orjson is optional but noticeably faster on the multi-MB importer payloads
+    from orjson import loads as load_json
+except ImportError:
+    from json import loads as load_json
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -234,9 +242,10 @@ def create_seal_charm_filter(
 
 
 def unique_filter_name(filter_name_template: str, filters: list[dict]) -> str:
+    used_names = {name for existing_filter in filters for name in existing_filter}
     filter_name = filter_name_template
     i = 2
-    while any(filter_name == next(iter(existing_filter)) for existing_filter in filters):
+    while filter_name in used_names:
         filter_name = f"{filter_name_template}{i}"
         i += 1
     return filter_name
@@ -270,20 +279,23 @@ def deduplicate_filters(
             groups.append((base_name, filter_spec, 1))
 
     result: list[dict[str, ItemFilterModel | CharmFilterModel | SealFilterModel]] = []
-    used_names: list[dict[str, ItemFilterModel | CharmFilterModel | SealFilterModel]] = []
+    used_names: set[str] = set()
     for base_name, model, count in groups:
         if count > 1:
-            candidate = f"{base_name}(x{count})"
+            key = f"{base_name}(x{count})"
             # Ensure uniqueness when multiple groups share the same count suffix
             suffix = 2
-            while any(candidate == next(iter(existing)) for existing in used_names):
-                candidate = f"{base_name}{suffix}(x{count})"
+            while key in used_names:
+                key = f"{base_name}{suffix}(x{count})"
                 suffix += 1
-            key = candidate
         else:
-            key = unique_filter_name(base_name, used_names)
+            key = base_name
+            suffix = 2
+            while key in used_names:
+                key = f"{base_name}{suffix}"
+                suffix += 1
         result.append({key: model})
-        used_names.append({key: model})
+        used_names.add(key)
     return result
 
 
@@ -300,8 +312,8 @@ def sort_profile_filters(filters: list[dict[str, ItemFilterModel]]) -> list[dict
 
 
 def _profile_filter_sort_key(filter_entry: dict[str, ItemFilterModel]) -> str:
-    filter_name, _ = next(iter(filter_entry.items()))
-    return filter_name.casefold()
+    # Each entry holds exactly one key; iterate keys directly instead of building items() tuples
+    return next(iter(filter_entry)).casefold()
 
 
 def get_with_retry(url: str, custom_headers: dict[str, str] | None = None) -> httpx.Response:
@@ -347,17 +359,14 @@ def retry_importer(func=None, inject_webdriver: bool = False, uc=False):
     def decorator_retry_importer(wrap_function):
         @functools.wraps(wrap_function)
         def wrapper(*args, **kwargs):
-            if inject_webdriver and "driver" not in kwargs and not args:
-                kwargs["driver"] = setup_webdriver(uc=uc)
+            inject = inject_webdriver and "driver" not in kwargs and not args
             for _ in range(2):
+                if inject:
+                    kwargs["driver"] = _shared_webdriver(uc=uc)
                 try:
-                    res = wrap_function(*args, **kwargs)
-                    if inject_webdriver and "driver" in kwargs:
-                        kwargs["driver"].quit()
+                    return wrap_function(*args, **kwargs)
                 except Exception:
                     LOGGER.exception("An error occurred while importing. Retrying...")
-                else:
-                    return res
             return None
 
         return wrapper
@@ -365,6 +374,33 @@ def retry_importer(func=None, inject_webdriver: bool = False, uc=False):
     return decorator_retry_importer if func is None else decorator_retry_importer(func)
 
 
+_WEBDRIVER_CACHE: dict[bool, ChromiumDriver] = {}
+
+
+def _shared_webdriver(uc: bool = False) -> ChromiumDriver:
+    """Reuse one browser per importer flavor; spawning a fresh one costs several seconds per import."""
+    driver = _WEBDRIVER_CACHE.get(uc)
+    if driver is not None:
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            with contextlib.suppress(WebDriverException):
+                driver.quit()
+            driver = None
+    if driver is None:
+        driver = setup_webdriver(uc=uc)
+        _WEBDRIVER_CACHE[uc] = driver
+    return driver
+
+
+@atexit.register
+def _quit_shared_webdrivers() -> None:
+    for driver in _WEBDRIVER_CACHE.values():
+        with contextlib.suppress(Exception):
+            driver.quit()
+
+
 def add_to_profiles(build_name):
     profiles = IniConfigLoader().general.profiles
     if build_name in profiles:
@@ -375,6 +411,14 @@ def add_to_profiles(build_name):
         LOGGER.info(f"Added {build_name} to active profiles configuration")
 
 
+# The importers only read DOM structure and text, so skip downloading static resources
+_CHROMIUM_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+
 def setup_webdriver(uc: bool = False) -> ChromiumDriver:
     if uc:
         return Driver(uc=uc, headless2=True, agent=HEADERS["User-Agent"])
@@ -384,16 +428,21 @@ def setup_webdriver(uc: bool = False) -> ChromiumDriver:
             options.add_argument("--headless=new")
             options.add_argument("log-level=3")
             options.add_argument(f"--user-agent={HEADERS['User-Agent']}")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", _CHROMIUM_CONTENT_PREFS)
             driver = webdriver.Edge(options=options)
         case BrowserType.chrome:
             options = webdriver.ChromeOptions()
             options.add_argument("--headless=new")
             options.add_argument("log-level=3")
             options.add_argument(f"--user-agent={HEADERS['User-Agent']}")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", _CHROMIUM_CONTENT_PREFS)
             driver = webdriver.Chrome(options=options)
         case BrowserType.firefox:
             options = webdriver.FirefoxOptions()
             options.add_argument("--headless")
             options.set_preference("general.useragent.override", HEADERS["User-Agent"])
+            options.set_preference("permissions.default.image", 2)
             driver = webdriver.Firefox(options=options)
     return driver  # It must be one of the 3 browsers due to ini validation
@@ -1,8 +1,10 @@
+import functools
 import json
 import logging
 import re
 
 import lxml.html
+from lxml import etree
 
 import src.logger
 from src.config.profile_document import ProfileDocumentStore
@@ -26,6 +28,7 @@ from src.gui.importer.gui_common import (
     fix_offhand_type,
     fix_weapon_type,
     get_with_retry,
+    load_json,
     match_to_enum,
     retry_importer,
     sort_profile_filters,
@@ -45,10 +48,14 @@ BUILD_GUIDE_BASE_URL = "https://maxroll.gg/d4/build-guides/"
 PLANNER_API_BASE_URL = "https://planners.maxroll.gg/profiles/d4/"
 PLANNER_API_DATA_URL = "https://assets-ng.maxroll.gg/d4-tools/game/data.min.json?95bc2915"
 PLANNER_BASE_URL = "https://maxroll.gg/d4/planner/"
-SCRIPT_XPATH = "//div[@id='root']/script"
+SCRIPT_XPATH = etree.XPath("//div[@id='root']/script")
 BUILD_SCRIPT_PREFIX = "window.__remixContext = "
 PLANNER_API_REGEX = re.compile(r'(https://maxroll\.gg/d4/planner/[^"|\\]*)')
 SKILL_RANK_BONUS_FORMULAS = {"GearAffix_SkillRankBonus", "GearAffix_SkillRankBonus_1to2"}
+OFFHAND_TYPE_WORDS = ("focus", "off hand", "shield", "totem")
+CLEAN_DESC_REGEX = re.compile(r"\[.*?\]|[^a-zA-Z ]")
+SEAL_SKILL_DESC_REGEX = re.compile(r"\{c_important\}([^{}]+)\{/c\}\s*(.+)$")
+SET_NAME_DESC_REGEX = re.compile(r"\{c_set\}([^{}]+)\{/c\}")
 SKILL_RANK_AFFIX_KEY_REGEX = re.compile(r"(?:_Category_|_Special_)(?P<label>[A-Za-z0-9]+)")
 SKILL_RANK_DESC_LABEL_REGEX = re.compile(r"\{c_important\}([^{}]+)\{/c\}\s+Skills")
 
@@ -75,17 +82,16 @@ def import_maxroll(config: ImportConfig):
         return
     all_data = r.json()
     guide_season = all_data.get("season", "")
-    build_data = json.loads(all_data["data"])
+    build_data = load_json(all_data["data"])
     if build_id_is_visible_position:
         build_id = _resolve_visible_profile_index(build_data["profiles"], build_id)
     items = build_data["items"]
     try:
-        mapping_data = get_with_retry(url=PLANNER_API_DATA_URL).json()
+        mapping_data = _get_mapping_data(PLANNER_API_DATA_URL)
     except ConnectionError:
         LOGGER.error("Couldn't get planner data")
         return
-    # The attribute descriptions are not always consistent with the casing for the key so we fix that here
-    mapping_data["attributeDescriptions"] = {k.lower(): v for k, v in mapping_data["attributeDescriptions"].items()}
+    affix_index = _build_affix_index(mapping_data)
     active_profile = build_data["profiles"][build_id]
     build_header = all_data["name"] or all_data["class"]
     variant_name = active_profile["name"] or ""
@@ -95,10 +101,13 @@ def import_maxroll(config: ImportConfig):
     if variant_name:
         build_name += f"_{variant_name}"
     finished_filters = []
+    used_filter_names: set[str] = set()
     charm_filters = []
     seal_filters = []
     aspect_upgrade_filters = []
     mythic_names = []
+    aspect_list = Dataloader().aspect_list
+    affix_resolution_cache: dict[tuple[int, ItemType], str] = {}
     for item_id in active_profile["items"].values():
         resolved_item = items[str(item_id)]
         resolved_item_id = resolved_item["id"]
@@ -128,6 +137,8 @@ def import_maxroll(config: ImportConfig):
                 item_affixes=resolved_item["explicits"],
                 item_type=item_type,
                 import_greater_affixes=config.import_greater_affixes,
+                affix_index=affix_index,
+                resolution_cache=affix_resolution_cache,
             )
             # Extract unique aspect and set info for charms
             charm_or_seal_unique_aspect = None
@@ -162,10 +173,10 @@ def import_maxroll(config: ImportConfig):
         # Legendary aspect upgrade handling
         if rarity == ItemRarity.Legendary and config.import_aspect_upgrades:
             legendary_aspect = _find_legendary_aspect(
-                mapping_data, resolved_item.get("legendaryPower", resolved_item.get("aspects", {}))
+                mapping_data, resolved_item.get("legendaryPower", resolved_item.get("aspects", {})), affix_index
             )
             if legendary_aspect:
-                if legendary_aspect not in Dataloader().aspect_list:
+                if legendary_aspect not in aspect_list:
                     LOGGER.warning(
                         f"Found legendary aspect '{legendary_aspect}' that is not in our aspect data, unable to add "
                         f"to AspectUpgrades. Please report a bug."
@@ -197,6 +208,8 @@ def import_maxroll(config: ImportConfig):
                             item_affixes=resolved_item["explicits"],
                             item_type=item_type,
                             import_greater_affixes=config.import_greater_affixes,
+                            affix_index=affix_index,
+                            resolution_cache=affix_resolution_cache,
                         )
                     ],
                     minCount=1 if rarity == ItemRarity.Unique else 3,
@@ -207,10 +220,11 @@ def import_maxroll(config: ImportConfig):
         item_filter.min_power = 100
         filter_name = item_filter.item_type[0].name
         i = 2
-        while any(filter_name == next(iter(x)) for x in finished_filters):
+        while filter_name in used_filter_names:
             filter_name = f"{item_filter.item_type[0].name}{i}"
             i += 1
 
+        used_filter_names.add(filter_name)
         finished_filters.append({filter_name: item_filter})
 
     # Place all mythics in a single filter
@@ -255,12 +269,24 @@ def import_maxroll(config: ImportConfig):
     LOGGER.info("Finished")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_mapping_data(url: str) -> dict:
+    """The mapping data is several MB and essentially static; fetch and parse it only once per session."""
+    mapping_data = load_json(get_with_retry(url=url).content)
+    # The attribute descriptions are not always consistent with the casing for the key so we fix that here
+    mapping_data["attributeDescriptions"] = {k.lower(): v for k, v in mapping_data["attributeDescriptions"].items()}
+    return mapping_data
+
+
+ATTRIBUTE_DESCRIPTION_CORRECTIONS = {
+    "On_Hit_Vulnerable_Proc_Chance": "On_Hit_Vulnerable_Proc".lower(),
+    "Movement_Bonus_On_Elite_Kill": "Movement_Speed_Bonus_On_Elite_Kill".lower(),
+}
+
+
 def _attribute_description_corrections(input_str: str) -> str:
-    match input_str:
-        case "On_Hit_Vulnerable_Proc_Chance":
-            return "On_Hit_Vulnerable_Proc".lower()
-        case "Movement_Bonus_On_Elite_Kill":
-            return "Movement_Speed_Bonus_On_Elite_Kill".lower()
+    if (corrected := ATTRIBUTE_DESCRIPTION_CORRECTIONS.get(input_str)) is not None:
+        return corrected
     return input_str.lower()
 
 
@@ -280,113 +306,151 @@ def _find_item_rarity(resolved_item_id, mapping_data) -> ItemRarity:
     return ItemRarity.Common
 
 
+def _build_affix_index(mapping_data: dict) -> dict[int, tuple[str, dict]]:
+    """Index the (large) mapping affix dict by nid once so per-affix lookups are O(1)."""
+    return {affix["id"]: (affix_key, affix) for affix_key, affix in mapping_data["affixes"].items()}
+
+
+def _formula_damage_type(affix: dict, mapping_data: dict) -> str:
+    param = str(affix["attributes"][0]["param"])
+    if param in mapping_data["uiStrings"]["damageType"]:
+        return mapping_data["uiStrings"]["damageType"][param] + " Damage Multiplier"
+    if "desc" in affix:
+        # These are seal affixes and we have to get the skill from the description
+        match = SEAL_SKILL_DESC_REGEX.search(affix["desc"])
+        if match:
+            return f"{match.group(1)} {match.group(2)}"
+    return ""
+
+
+def _formula_resistance_single(affix: dict, mapping_data: dict) -> str:
+    return mapping_data["uiStrings"]["damageType"][str(affix["attributes"][0]["param"])] + " Resistance"
+
+
+def _formula_resource_per_second(affix: dict, mapping_data: dict) -> str:
+    return mapping_data["uiStrings"]["resourceType"][str(affix["attributes"][0]["param"])] + " Regeneration"
+
+
+def _formula_resource_on_kill(affix: dict, mapping_data: dict) -> str:
+    return mapping_data["uiStrings"]["resourceType"][str(affix["attributes"][0]["param"])] + " On Kill"
+
+
+FORMULA_HANDLERS = {
+    "GearAffix_DamageType": _formula_damage_type,
+    "GearAffix_DamageType_Greater": _formula_damage_type,
+    "GearAffix_Resistance_Single": _formula_resistance_single,
+    "GearAffix_Resource_Per_Second": _formula_resource_per_second,
+    "GearAffix_Resource_On_Kill": _formula_resource_on_kill,
+    "GearAffix_Resource_On_Kill_Warlock": _formula_resource_on_kill,
+}
+
+
 def _find_item_affixes(
-    mapping_data: dict, item_affixes: dict, item_type: ItemType, import_greater_affixes=False
+    mapping_data: dict,
+    item_affixes: dict,
+    item_type: ItemType,
+    import_greater_affixes=False,
+    affix_index: dict[int, tuple[str, dict]] | None = None,
+    resolution_cache: dict[tuple[int, ItemType], str] | None = None,
 ) -> list[Affix]:
     res = []
+    if affix_index is None:
+        affix_index = _build_affix_index(mapping_data)
     for affix_id in item_affixes:
-        for affix_key, affix in mapping_data["affixes"].items():
-            if affix["id"] != affix_id["nid"]:
-                continue
-            if affix["magicType"] in [2, 4]:
-                break
-            attr_desc = _attr_desc_special_handling(affix["id"])
-            if not attr_desc:
-                if "formula" in affix["attributes"][0] and affix["attributes"][0]["formula"] in [
-                    "GearAffix_Resource_Per_Second",
-                    "GearAffix_DamageType",
-                    "GearAffix_DamageType_Greater",
-                    "GearAffix_Resource_On_Kill",
-                    "GearAffix_Resource_On_Kill_Warlock",
-                    "GearAffix_Resistance_Single",
-                ]:
-                    if affix["attributes"][0]["formula"] in ["GearAffix_DamageType", "GearAffix_DamageType_Greater"]:
-                        param = str(affix["attributes"][0]["param"])
-                        if param in mapping_data["uiStrings"]["damageType"]:
-                            attr_desc = mapping_data["uiStrings"]["damageType"][param] + " Damage Multiplier"
-                        elif "desc" in affix:
-                            # These are seal affixes and we have to get the skill from the description
-                            pattern = r"\{c_important\}([^{}]+)\{/c\}\s*(.+)$"
-                            match = re.search(pattern, affix["desc"])
-                            if match:
-                                attr_desc = f"{match.group(1)} {match.group(2)}"
-                    elif affix["attributes"][0]["formula"] == "GearAffix_Resistance_Single":
-                        attr_desc = (
-                            mapping_data["uiStrings"]["damageType"][str(affix["attributes"][0]["param"])]
-                            + " Resistance"
-                        )
-                    elif affix["attributes"][0]["formula"] == "GearAffix_Resource_Per_Second":
-                        param = str(affix["attributes"][0]["param"])
-                        attr_desc = mapping_data["uiStrings"]["resourceType"][param] + " Regeneration"
-                    elif affix["attributes"][0]["formula"] in [
-                        "GearAffix_Resource_On_Kill",
-                        "GearAffix_Resource_On_Kill_Warlock",
-                    ]:
-                        attr_desc = (
-                            mapping_data["uiStrings"]["resourceType"][str(affix["attributes"][0]["param"])] + " On Kill"
-                        )
-                elif "param" not in affix["attributes"][0]:
-                    attr_id = affix["attributes"][0]["id"]
-                    attr_obj = mapping_data["attributes"][str(attr_id)]
-                    attr_desc = mapping_data["attributeDescriptions"].get(
-                        _attribute_description_corrections(attr_obj["name"])
+        nid = affix_id["nid"]
+        # Items of a build often share affix nids; the resolution pipeline below is
+        # deterministic in (nid, item_type), so reuse earlier results within an import.
+        if resolution_cache is not None and (cached_name := resolution_cache.get((nid, item_type))) is not None:
+            affix_obj = Affix(name=cached_name)
+            if import_greater_affixes and affix_id.get("greater", False):
+                affix_obj.type = AffixType.greater
+            res.append(affix_obj)
+            continue
+        if (indexed_affix := affix_index.get(nid)) is None:
+            continue
+        affix_key, affix = indexed_affix
+        if affix["magicType"] in [2, 4]:
+            continue
+        attr_desc = _attr_desc_special_handling(affix["id"])
+        if not attr_desc:
+            attribute = affix["attributes"][0]
+            if (formula_handler := FORMULA_HANDLERS.get(attribute.get("formula"))) is not None:
+                attr_desc = formula_handler(affix, mapping_data)
+            elif "param" not in attribute:
+                attr_id = attribute["id"]
+                attr_obj = mapping_data["attributes"][str(attr_id)]
+                attr_desc = mapping_data["attributeDescriptions"].get(
+                    _attribute_description_corrections(attr_obj["name"])
+                )
+                if not attr_desc:
+                    LOGGER.warning(
+                        f"Unable to map {attr_obj['name']} from MaxRoll data to an affix, skipping affix and please report a bug."
+                    )
+                    continue
+            else:  # must be + to talent or skill
+                attr_param = attribute["param"]
+                for skill_data in mapping_data["skills"].values():
+                    if skill_data["id"] == attr_param:
+                        attr_desc = f"to {skill_data['name']}"
+                        break
+                else:
+                    attr_desc = _find_skill_rank_affix_description(
+                        mapping_data=mapping_data, affix_key=affix_key, attribute=attribute
                     )
-                    if not attr_desc:
-                        LOGGER.warning(
-                            f"Unable to map {attr_obj['name']} from MaxRoll data to an affix, skipping affix and please report a bug."
-                        )
-                        continue
-                else:  # must be + to talent or skill
-                    attr_param = affix["attributes"][0]["param"]
-                    for skill_data in mapping_data["skills"].values():
-                        if skill_data["id"] == attr_param:
-                            attr_desc = f"to {skill_data['name']}"
-                            break
-                    else:
-                        attr_desc = _find_skill_rank_affix_description(
-                            mapping_data=mapping_data, affix_key=affix_key, attribute=affix["attributes"][0]
-                        )
 
-                # Below is handling for seal affixes tied to a set. We attach the set to the front.
-                # If this ends up not working for some reason, a second option is to take the key
-                # like "Talisman_SealAffix_Set_Barbarian_05_AncientSkillRankBonus" and convert it to
-                # "Talisman_Barbarian_05" and then find that in the mapping data. That will also give set name.
-                if "Talisman" in affix_key and "Set" in affix_key:
-                    pattern = r"\{c_set\}([^{}]+)\{/c\}"
-                    match = re.search(pattern, affix["desc"]) if "desc" in affix else None
-                    if match:
-                        attr_desc = match.group(1) + " " + attr_desc
-                    else:
-                        LOGGER.warning(
-                            f"We thought affix {attr_desc} was a seal-based affix activated by a set but we could not determine the set. The affix is skipped, please report a bug with a link to the build."
-                        )
-                        continue
+            # Below is handling for seal affixes tied to a set. We attach the set to the front.
+            # If this ends up not working for some reason, a second option is to take the key
+            # like "Talisman_SealAffix_Set_Barbarian_05_AncientSkillRankBonus" and convert it to
+            # "Talisman_Barbarian_05" and then find that in the mapping data. That will also give set name.
+            if "Talisman" in affix_key and "Set" in affix_key:
+                match = SET_NAME_DESC_REGEX.search(affix["desc"]) if "desc" in affix else None
+                if match:
+                    attr_desc = match.group(1) + " " + attr_desc
+                else:
+                    LOGGER.warning(
+                        f"We thought affix {attr_desc} was a seal-based affix activated by a set but we could not determine the set. The affix is skipped, please report a bug with a link to the build."
+                    )
+                    continue
 
-            clean_desc = re.sub(r"\[.*?\]|[^a-zA-Z ]", "", attr_desc)
-            clean_desc = clean_desc.replace("SecondSeconds", "seconds")
-            if not clean_desc:
-                LOGGER.warning(
-                    f"We were unable to map an attribute on item type {item_type.value} to an affix. Please report a bug and include a link to the build, we are skipping that affix."
-                )
-                continue
+        clean_desc = CLEAN_DESC_REGEX.sub("", attr_desc)
+        clean_desc = clean_desc.replace("SecondSeconds", "seconds")
+        if not clean_desc:
+            LOGGER.warning(
+                f"We were unable to map an attribute on item type {item_type.value} to an affix. Please report a bug and include a link to the build, we are skipping that affix."
+            )
+            continue
 
-            affix_dict = affix_dict_for_item_type(item_type=item_type)
-            affix_obj = Affix(name=closest_match(clean_str(clean_desc), affix_dict))
-            if import_greater_affixes and affix_id.get("greater", False):
-                affix_obj.type = AffixType.greater
-            if affix_obj.name is not None:
-                res.append(affix_obj)
-            elif (
-                "formula" in affix["attributes"][0]
-                and affix["attributes"][0]["formula"] == "InherentAffixAnyResist_Ring"
-            ):
-                LOGGER.info("Skipping InherentAffixAnyResist_Ring")
-            else:
-                LOGGER.error(f"Couldn't match {affix_id=}")
-            break
+        affix_obj = Affix(name=_resolve_affix_name(clean_str(clean_desc), item_type))
+        if import_greater_affixes and affix_id.get("greater", False):
+            affix_obj.type = AffixType.greater
+        if affix_obj.name is not None:
+            if resolution_cache is not None:
+                resolution_cache[(nid, item_type)] = affix_obj.name
+            res.append(affix_obj)
+        elif "formula" in affix["attributes"][0] and affix["attributes"][0]["formula"] == "InherentAffixAnyResist_Ring":
+            LOGGER.info("Skipping InherentAffixAnyResist_Ring")
+        else:
+            LOGGER.error(f"Couldn't match {affix_id=}")
     return res
 
 
+@functools.lru_cache(maxsize=None)
+def _exact_affix_names(item_type: ItemType) -> dict[str, str]:
+    """Reverse map from display name to affix key; first key wins, like closest_match on a tie."""
+    exact: dict[str, str] = {}
+    for key, name in affix_dict_for_item_type(item_type=item_type).items():
+        exact.setdefault(name, key)
+    return exact
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_affix_name(cleaned: str, item_type: ItemType) -> str | None:
+    """The same attribute descriptions repeat across items; cache the fuzzy match per cleaned string."""
+    if (exact := _exact_affix_names(item_type).get(cleaned)) is not None:
+        return exact
+    return closest_match(cleaned, affix_dict_for_item_type(item_type=item_type))
+
+
 def _find_skill_rank_affix_description(mapping_data: dict, affix_key: str, attribute: dict) -> str:
     if attribute.get("formula") not in SKILL_RANK_BONUS_FORMULAS:
         return ""
@@ -426,80 +490,73 @@ def _find_skill_rank_label_from_affix_key(affix_key: str) -> str:
     return ""
 
 
-def _find_legendary_aspect(mapping_data: dict, legendary_aspect: dict) -> str | None:
+def _find_legendary_aspect(
+    mapping_data: dict, legendary_aspect: dict, affix_index: dict[int, tuple[str, dict]] | None = None
+) -> str | None:
     if not legendary_aspect:
         return None
 
     if isinstance(legendary_aspect, list):
         legendary_aspect = legendary_aspect[0]
 
-    for affix in mapping_data["affixes"].values():
-        if affix["id"] != legendary_aspect["nid"]:
-            continue
-
-        if "prefix" in affix:
-            return correct_name(affix["prefix"])
-        if "suffix" in affix:
-            return correct_name(affix["suffix"])
+    if affix_index is None:
+        affix_index = _build_affix_index(mapping_data)
+    if (indexed_affix := affix_index.get(legendary_aspect["nid"])) is None:
         return None
-
+    _, affix = indexed_affix
+    if "prefix" in affix:
+        return correct_name(affix["prefix"])
+    if "suffix" in affix:
+        return correct_name(affix["suffix"])
     return None
 
 
+ATTR_DESC_SPECIAL_CASES = {
+    2609197: "charm slot",
+    # 1014505: "evade grants movement speed for second",
+    # 2051010: "evade grants movement speed for second",
+    # 2568489: "hunger increased reputation from kill streaks",
+    # 2568491: "hunger increased experience from kill streaks",
+    # 2057810: "damage reduction from bleeding enemies",
+    # 2067844: "maximum poison resistance",
+    # 2037914: "subterfuge cooldown reduction",
+    # 2123788: "chance for core skills to hit twice",
+    # 2119054: "chance for basic skills to deal double damage",
+    # 2119058: "basic lucky hit chance",
+    # 2052125: "non-physical damage",
+}
+
+UNIQUE_NAME_SPECIAL_CASES = {
+    "[PH] Season 7 Necro Pants": "kessimes_legacy",
+    "[PH] Season 7 Barb Chest": "mantle_of_mountains_fury",
+}
+
+
 def _attr_desc_special_handling(affix_id: str) -> str:
-    match affix_id:
-        case 2609197:
-            return "charm slot"
-        # case 1014505 | 2051010:
-        #     return "evade grants movement speed for second"
-        # case 2568489:
-        #     return "hunger increased reputation from kill streaks"
-        # case 2568491:
-        #     return "hunger increased experience from kill streaks"
-        # case 2057810:
-        #     return "damage reduction from bleeding enemies"
-        # case 2067844:
-        #     return "maximum poison resistance"
-        # case 2037914:
-        #     return "subterfuge cooldown reduction"
-        # case 2123788:
-        #     return "chance for core skills to hit twice"
-        # case 2119054:
-        #     return "chance for basic skills to deal double damage"
-        # case 2119058:
-        #     return "basic lucky hit chance"
-        # case 2052125:
-        #     return "non-physical damage"
-        case _:
-            return ""
+    return ATTR_DESC_SPECIAL_CASES.get(affix_id, "")
 
 
 def _unique_name_special_handling(unique_name: str) -> str:
-    match unique_name:
-        case "[PH] Season 7 Necro Pants":
-            return "kessimes_legacy"
-        case "[PH] Season 7 Barb Chest":
-            return "mantle_of_mountains_fury"
-        case _:
-            return unique_name.replace("\xa0", " ")
+    if (special := UNIQUE_NAME_SPECIAL_CASES.get(unique_name)) is not None:
+        return special
+    return unique_name.replace("\xa0", " ")
 
 
 def _find_item_type(mapping_data: dict, value: str, class_name: str = "") -> ItemType | None:
-    for d_key, d_value in mapping_data.items():
-        if d_key == value:
-            item_type_str = d_value["type"]
-            normalized_item_type_str = _normalize_item_type_str_for_import_helpers(item_type_str)
-            if (item_type := fix_weapon_type(input_str=normalized_item_type_str)) is not None:
-                return item_type
-            if (
-                any(substring in normalized_item_type_str for substring in ["focus", "off hand", "shield", "totem"])
-            ) and (item_type := fix_offhand_type(input_str=normalized_item_type_str, class_str=class_name)) is not None:
-                return item_type
-            if (res := match_to_enum(enum_class=ItemType, target_string=item_type_str, check_keys=True)) is None:
-                LOGGER.error("Couldn't match item type to enum")
-                return None
-            return res
-    return None
+    if (entry := mapping_data.get(value)) is None:
+        return None
+    item_type_str = entry["type"]
+    normalized_item_type_str = _normalize_item_type_str_for_import_helpers(item_type_str)
+    if (item_type := fix_weapon_type(input_str=normalized_item_type_str)) is not None:
+        return item_type
+    if (any(substring in normalized_item_type_str for substring in OFFHAND_TYPE_WORDS)) and (
+        item_type := fix_offhand_type(input_str=normalized_item_type_str, class_str=class_name)
+    ) is not None:
+        return item_type
+    if (res := match_to_enum(enum_class=ItemType, target_string=item_type_str, check_keys=True)) is None:
+        LOGGER.error("Couldn't match item type to enum")
+        return None
+    return res
 
 
 def _normalize_item_type_str_for_import_helpers(item_type_str: str) -> str:
@@ -539,9 +596,10 @@ def _extract_planner_url_and_id_from_guide(url: str) -> tuple[str, int, bool]:
     except ConnectionError as exc:
         LOGGER.exception(msg := "Couldn't get build guide")
         raise MaxrollError(msg) from exc
-    data = lxml.html.fromstring(r.text)
+    # Feed lxml the raw bytes; parsing r.text would decode to str only for lxml to re-encode it
+    data = lxml.html.fromstring(r.content)
     # As of season 13, the link to the planner is stuck in a script so we get it from there
-    script_elements = data.xpath(SCRIPT_XPATH)
+    script_elements = SCRIPT_XPATH(data)
     for script_element in script_elements:
         if script_element.text and script_element.text.strip().startswith(BUILD_SCRIPT_PREFIX):
             planner_link = PLANNER_API_REGEX.search(script_element.text).group()
@@ -1,12 +1,11 @@
-import json
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
-import jsonpath
-import lxml.html
 import rapidfuzz
+from lxml import etree
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as ec
@@ -33,6 +32,7 @@ from src.gui.importer.gui_common import (
     deduplicate_filters,
     fix_offhand_type,
     fix_weapon_type,
+    load_json,
     match_to_enum,
     retry_importer,
     sort_profile_filters,
@@ -52,6 +52,9 @@ PROFILE_GUIDE_BASE_URL = f"{BUILD_GUIDE_BASE_URL}profile"
 SCRIPT_XPATH = "//script"
 BUILD_SCRIPT_PREFIX = "window.__PRELOADED_STATE__="
 CHARM_ICON_SET_SLUG_REGEX = re.compile(r"/charms/(?P<slug>[^/?#]+?)(?:\.[^/.?#]+)?(?:[?#]|$)")
+DIGIT_REGEX = re.compile(r"\d+")
+ACCEPTED_ENTITY_TYPES = frozenset({"aspects", "uniqueItems", "charms", "seals", "items"})
+SEASON_TAG_REGEX = re.compile(r"\bSeason\s+(\d+)\b", re.IGNORECASE)
 PAGE_DIAGNOSTIC_MARKERS = (
     "__PRELOADED_STATE__",
     "__NEXT_DATA__",
@@ -73,6 +76,33 @@ class MobalyticsError(Exception):
     pass
 
 
+def _find_first_key(data: dict | list, key: str):
+    """Single recursive walk locating the first occurrence of a key anywhere in the tree.
+
+    Replaces the recursive-descent jsonpath queries that re-walked the whole preloaded state
+    per expression; everything below the located node is addressed with plain indexing.
+    """
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        for value in data.values():
+            if (found := _find_first_key(value, key)) is not None:
+                return found
+    elif isinstance(data, list):
+        for value in data:
+            if (found := _find_first_key(value, key)) is not None:
+                return found
+    return None
+
+
+def _dig(data: dict, *keys: str):
+    """Direct traversal for known key paths; much cheaper than a jsonpath query per access."""
+    for key in keys:
+        if not isinstance(data, dict) or (data := data.get(key)) is None:
+            return None
+    return data
+
+
 @retry_importer(inject_webdriver=True)
 def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
     url = config.url.strip().replace("\n", "")
@@ -89,46 +119,48 @@ def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
     wait.until(ec.presence_of_element_located((By.XPATH, SCRIPT_XPATH)))
     variant_id = url.split(",")[1].split("#")[0] if "activeVariantId" in url else None
     page_source = driver.page_source
-    raw_html_data = lxml.html.fromstring(page_source)
     # The build is shoved in a massive JSON in one of the script tags. We find that json now.
-    scripts_elem = raw_html_data.xpath(SCRIPT_XPATH)
-    full_script_data_json = None
-    for script in scripts_elem:
-        if script.text and script.text.strip().startswith(BUILD_SCRIPT_PREFIX):
-            full_script_data_json = json.loads(script.text.strip().replace(BUILD_SCRIPT_PREFIX, "")[:-1])
-            break
+    full_script_data_json, script_count = _extract_preloaded_state(page_source)
 
     if not full_script_data_json:
-        _log_mobalytics_page_diagnostics(driver=driver, page_source=page_source, script_count=len(scripts_elem))
+        _log_mobalytics_page_diagnostics(driver=driver, page_source=page_source, script_count=script_count)
         LOGGER.error(
             msg
             := "No script containing build data was found. This means Mobalytics has changed how they present data, please submit a bug."
         )
         raise MobalyticsError(msg)
 
-    # Get the JSON block that contains the build and its variants
-    build_data = dict(jsonpath.findall("$..userGeneratedDocumentBySlug.data.data", full_script_data_json)[0])
-    season_number = _extract_mobalytics_season_number(full_script_data_json)
+    # Get the JSON block that contains the build and its variants. One recursive walk locates
+    # the document; everything below it is a known structure we index directly.
+    document_data = (_find_first_key(full_script_data_json, "userGeneratedDocumentBySlug") or {}).get("data") or {}
+    build_data = dict(document_data.get("data") or {})
+    if not build_data:
+        LOGGER.error(msg := "No build data found")
+        raise MobalyticsError(msg)
+    tags = (document_data.get("tags") or {}).get("data") or []
+    season_number = _extract_mobalytics_season_number(tags)
     build_header = build_data["name"]
     if not build_header:
         LOGGER.error(msg := "No build name found")
         raise MobalyticsError(msg)
-    class_name = jsonpath.findall(
-        "$..userGeneratedDocumentBySlug.data.tags.data[?@.groupSlug=='class'].name", full_script_data_json
-    )[0].lower()
+    class_tag = next((tag for tag in tags if tag.get("groupSlug") == "class"), None)
+    class_name = str(class_tag["name"]).lower() if class_tag else ""
     if not class_name:
         LOGGER.error(msg := "No class name found")
         raise MobalyticsError(msg)
-    if variant_id:
-        items = jsonpath.findall(f"$..buildVariants.values[?@.id=='{variant_id}'].genericBuilder.slots", build_data)[0]
-    else:
-        items = jsonpath.findall("$..buildVariants.values[0].genericBuilder.slots", build_data)[0]
-        variant_id = jsonpath.findall("$..buildVariants.values[0].id", build_data)[0]
-
-    paragon_data = jsonpath.findall(f"$..buildVariants.values[?@.id=='{variant_id}'].paragon", build_data)[0]
+    # Locate the variant list once and index it directly instead of filtering per lookup
+    all_variants = (_find_first_key(build_data, "buildVariants") or {}).get("values") or []
+    if not variant_id and all_variants:
+        variant_id = all_variants[0]["id"]
+    active_variant = next((x for x in all_variants if x.get("id") == variant_id), None)
+    if active_variant is None:
+        LOGGER.error(msg := "No build variants found")
+        raise MobalyticsError(msg)
+    items = _dig(active_variant, "genericBuilder", "slots")
+    paragon_data = active_variant["paragon"]
 
-    variant_name = jsonpath.findall(f"$..childrenVariants[?@.id=='{variant_id}'].title", full_script_data_json)
-    variant_name = variant_name[0] if variant_name else ""
+    children_variants = _find_first_key(full_script_data_json, "childrenVariants") or []
+    variant_name = next((x.get("title") for x in children_variants if x.get("id") == variant_id), None) or ""
     build_name = f"{build_header} {variant_name}".strip() if variant_name else build_header
 
     if not items:
@@ -141,32 +173,34 @@ def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
     mythic_names = []
     aspect_upgrade_filters = []
     guessed_set_name = None
-    for item in sorted(items, key=lambda item: jsonpath.findall(".gameEntity.type", item)[0] != "charms"):
+    aspect_unique_dict = Dataloader().aspect_unique_dict
+    for item in sorted(items, key=lambda item: _dig(item, "gameEntity", "type") != "charms"):
         item_filter = ItemFilterModel()
-        entity_type = jsonpath.findall(".gameEntity.type", item)[0]
-        mythic_result = jsonpath.findall(".gameEntity.entity.mythic", item)
-        is_mythic = mythic_result[0] if mythic_result else False
-        if entity_type not in ["aspects", "uniqueItems", "charms", "seals", "items"]:
+        game_entity = item.get("gameEntity") or {}
+        entity = game_entity.get("entity") or {}
+        entity_type = game_entity.get("type")
+        is_mythic = entity.get("mythic") or False
+        if entity_type not in ACCEPTED_ENTITY_TYPES:
             continue
-        title_result = jsonpath.findall(".gameEntity.entity.title", item) or jsonpath.findall(".gameEntity.title", item)
-        item_name = str(title_result[0]).strip() if title_result else ""
+        title = entity.get("title") or game_entity.get("title")
+        item_name = str(title).strip() if title else ""
+        slot_slug = item.get("gameSlotSlug")
         if not item_name:
-            slot_result = jsonpath.findall(".gameSlotSlug", item)
             LOGGER.warning(
-                f"Skipping {slot_result[0] if slot_result else '(unknown slot)'} ({entity_type}) because it has no title."
+                f"Skipping {slot_slug if slot_slug else '(unknown slot)'} ({entity_type}) because it has no title."
             )
             continue
-        slot_result = jsonpath.findall(".gameSlotSlug", item)
-        if not slot_result or not (slot_type := str(slot_result[0]).strip()):
+        if not slot_slug or not (slot_type := str(slot_slug).strip()):
             LOGGER.error(msg := f"No slot type found for {item_name}")
             raise MobalyticsError(msg)
 
+        modifiers = game_entity.get("modifiers") or {}
         raw_affixes = (
-            jsonpath.findall(".gameEntity.modifiers.gearStats[*]", item)
-            + jsonpath.findall(".gameEntity.modifiers.sealStats[*]", item)
-            + jsonpath.findall(".gameEntity.modifiers.charmStats[*]", item)
+            (modifiers.get("gearStats") or [])
+            + (modifiers.get("sealStats") or [])
+            + (modifiers.get("charmStats") or [])
         )
-        raw_inherents = jsonpath.findall(".gameEntity.modifiers.implicitStats[*]", item)
+        raw_inherents = modifiers.get("implicitStats") or []
         raw_affixes = [x for x in raw_affixes if x is not None]
         raw_inherents = [x for x in raw_inherents if x is not None]
 
@@ -217,7 +251,7 @@ def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
             item_type = ItemType.Charm
         else:
             item_type = (
-                match_to_enum(enum_class=ItemType, target_string=re.sub(r"\d+", "", slot_type))
+                match_to_enum(enum_class=ItemType, target_string=DIGIT_REGEX.sub("", slot_type))
                 if item_type is None
                 else item_type
             )
@@ -246,7 +280,7 @@ def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
             charm_set_name = None
             if item_type == ItemType.Charm:
                 normalized_item_name = correct_name(item_name)
-                if normalized_item_name in Dataloader().aspect_unique_dict:
+                if normalized_item_name in aspect_unique_dict:
                     charm_unique_aspect = normalized_item_name
                 charm_set_name = _extract_mobalytics_charm_set_name(item)
             if not affixes and not charm_unique_aspect and not charm_set_name:
@@ -266,19 +300,18 @@ def import_mobalytics(config: ImportConfig, driver: ChromiumDriver = None):
 
         if not is_mythic:
             affixes = sorted(affixes, key=lambda affix: (affix.name, affix.type.value))
-            item_filter.affix_pool = [
-                AffixFilterCountModel(
-                    count=[AffixFilterModel(name=x.name, want_greater=x.type == AffixType.greater) for x in affixes],
-                    min_count=1 if is_unique else 3,
-                )
+            # The names come straight out of the affix dict, so skip re-validating each model
+            affix_models = [
+                AffixFilterModel.model_construct(name=x.name, want_greater=x.type == AffixType.greater)
+                for x in affixes
             ]
+            item_filter.affix_pool = [AffixFilterCountModel(count=affix_models, min_count=1 if is_unique else 3)]
             update_mingreateraffixcount(item_filter, config.require_greater_affixes)
         item_filter.min_power = 100
         if inherents and not is_mythic:
             inherents = sorted(inherents, key=lambda affix: (affix.name, affix.type.value))
-            item_filter.inherent_pool = [
-                AffixFilterCountModel(count=[AffixFilterModel(name=x.name) for x in inherents])
-            ]
+            inherent_models = [AffixFilterModel.model_construct(name=x.name) for x in inherents]
+            item_filter.inherent_pool = [AffixFilterCountModel(count=inherent_models)]
         finished_filters.append(item_filter)
 
     # Place all mythics in a single filter
@@ -332,6 +365,47 @@ def _fix_input_url(url: str) -> str:
     return unquote(url)
 
 
+def _extract_preloaded_state(page_source: str) -> tuple[dict | None, int]:
+    """Locate and parse the preloaded-state JSON.
+
+    A plain substring search finds the assignment without touching an HTML parser at all; only
+    if that slice does not parse (e.g. the sentinel appeared inside some other script) do we
+    fall back to scanning the script tags. Returns the parsed state (or None) and the number
+    of script tags seen by the fallback scan (0 when the fast path succeeds).
+    """
+    start = page_source.find(BUILD_SCRIPT_PREFIX)
+    if start != -1 and (end := page_source.find("</script>", start)) != -1:
+        try:
+            return load_json(page_source[start + len(BUILD_SCRIPT_PREFIX) : end].rstrip().rstrip(";")), 0
+        except ValueError:
+            LOGGER.debug("Direct preloaded-state extraction did not parse, falling back to the script scan")
+    script_text, script_count = _find_build_script_text(page_source)
+    if script_text:
+        return load_json(script_text.strip()[len(BUILD_SCRIPT_PREFIX) : -1]), script_count
+    return None, script_count
+
+
+def _find_build_script_text(page_source: str) -> tuple[str | None, int]:
+    """Pull-parse the page and stop at the first script tag carrying the preloaded state.
+
+    Building the full DOM just to scan script tags is wasted work; feeding the parser in
+    chunks lets us bail out as soon as the state script (usually early in the page) is seen.
+    Returns the script text (or None) and the number of script tags seen so far.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="script")
+    script_count = 0
+    chunk_size = 1 << 20
+    for start in range(0, len(page_source), chunk_size):
+        parser.feed(page_source[start : start + chunk_size])
+        for _, elem in parser.read_events():
+            script_count += 1
+            text = elem.text
+            elem.clear()
+            if text and text.strip().startswith(BUILD_SCRIPT_PREFIX):
+                return text, script_count
+    return None, script_count
+
+
 def _log_mobalytics_page_diagnostics(driver: ChromiumDriver, page_source: str, script_count: int) -> None:
     page_source_casefold = page_source.casefold()
     matched_markers = [marker for marker in PAGE_DIAGNOSTIC_MARKERS if marker.casefold() in page_source_casefold]
@@ -353,15 +427,11 @@ def _read_mobalytics_driver_value(driver: ChromiumDriver, value_name: str) -> st
     return str(value)
 
 
-def _extract_mobalytics_season_number(full_script_data_json: dict) -> str:
-    tag_names = jsonpath.findall("$..userGeneratedDocumentBySlug.data.tags.data[*].name", full_script_data_json)
-    for tag_name in tag_names:
-        if season_match := re.search(r"\bSeason\s+(\d+)\b", str(tag_name), flags=re.IGNORECASE):
-            season_number = season_match.group(1)
-            break
-    else:
-        season_number = ""
-    return season_number
+def _extract_mobalytics_season_number(tags: list[dict]) -> str:
+    for tag in tags:
+        if season_match := SEASON_TAG_REGEX.search(str(tag.get("name", ""))):
+            return season_match.group(1)
+    return ""
 
 
 def _get_legendary_aspect(name: str) -> str:
@@ -378,26 +448,29 @@ def _get_legendary_aspect(name: str) -> str:
 
 
 def _extract_mobalytics_charm_set_name(item: dict) -> str | None:
-    icon_url = (jsonpath.findall(".gameEntity.iconUrl", item) or [""])[0]
+    icon_url = _dig(item, "gameEntity", "iconUrl") or ""
     match = CHARM_ICON_SET_SLUG_REGEX.search(str(icon_url))
     if not match:
         return None
 
     set_candidate = correct_name(match.group("slug").replace("-", " "))
-    if set_candidate in Dataloader().set_list:
+    set_list = Dataloader().set_list
+    if set_candidate in set_list:
         return set_candidate
 
     compact_candidate = set_candidate.replace("_", "").replace("-", "")
     return next(
-        (
-            set_name
-            for set_name in Dataloader().set_list
-            if set_name.replace("_", "").replace("-", "") == compact_candidate
-        ),
+        (set_name for set_name in set_list if set_name.replace("_", "").replace("-", "") == compact_candidate),
         None,
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve_affix_name(cleaned: str, item_type: ItemType | None) -> str | None:
+    """The same stat ids recur across items and builds; cache the fuzzy match per cleaned string."""
+    return closest_match(cleaned, affix_dict_for_item_type(item_type=item_type))
+
+
 def _convert_raw_to_affixes(
     raw_stats: list[dict],
     import_greater_affixes=False,
@@ -406,6 +479,8 @@ def _convert_raw_to_affixes(
 ) -> list[Affix]:
     result = []
     affix_dict = affix_dict_for_item_type(item_type=item_type)
+    seal_affix_dict = Dataloader().seal_affix_dict
+    set_list = Dataloader().set_list
     for stat in raw_stats:
         if stat:
             stat_id = stat["id"]
@@ -414,14 +489,14 @@ def _convert_raw_to_affixes(
             matched_name = None
             if item_type == ItemType.HoradricSeal and guessed_set_name:
                 # First check if the stat is a generic affix with an exact or very close match
-                best_global_key = closest_match(stat_clean, affix_dict)
+                best_global_key = _resolve_affix_name(stat_clean, item_type)
                 is_exact_generic = False
                 if best_global_key and best_global_key != "damage":
                     global_display = affix_dict[best_global_key]
                     if rapidfuzz.distance.Levenshtein.distance(stat_clean, global_display) <= 2:
                         # Ensure it's not a set-specific affix of another set
                         is_set_specific = False
-                        for set_name in Dataloader().set_list:
+                        for set_name in set_list:
                             if best_global_key.startswith(set_name + "_"):
                                 is_set_specific = True
                                 break
@@ -430,16 +505,14 @@ def _convert_raw_to_affixes(
                             matched_name = best_global_key
 
                 if not is_exact_generic:
-                    set_keys = {
-                        k: v for k, v in Dataloader().seal_affix_dict.items() if k.startswith(guessed_set_name + "_")
-                    }
+                    set_keys = {k: v for k, v in seal_affix_dict.items() if k.startswith(guessed_set_name + "_")}
                     potential_match = closest_match(stat_clean, set_keys)
                     if potential_match:
-                        display_name = Dataloader().seal_affix_dict[potential_match]
+                        display_name = seal_affix_dict[potential_match]
                         if rapidfuzz.fuzz.token_set_ratio(stat_clean, display_name) >= 50:
                             matched_name = potential_match
             if matched_name is None:
-                matched_name = closest_match(stat_clean, affix_dict)
+                matched_name = _resolve_affix_name(stat_clean, item_type)
 
             affix_obj = Affix(name=matched_name)
             if affix_obj.name is None:
@@ -5,13 +5,19 @@ import rapidfuzz.distance.Levenshtein
 
 from src.dataloader import Dataloader
 
+_NUMBER_SEPARATOR_REGEX = re.compile(r"(\d)[, ]+(\d)")
+_NUMBER_REGEX = re.compile(r"(\+)?\d+(\.\d+)?%?")
+_SPECIAL_CHARS_REGEX = re.compile(r"[\[\]+\-:%\'#]")
+_FIND_NUMBER_REGEX = re.compile(r"[+-]?(\d+\.\d+|\.\d+|\d+\.?|\d+)\%?")
+
 
 def closest_match(target, candidates):
-    keys, values = zip(*candidates.items(), strict=False)
+    # extractOne accepts the mapping directly and returns the matched key, so there is no need
+    # to rebuild key/value tuples per call or rescan the values for the winner's index
     result = rapidfuzz.process.extractOne(
-        target, values, scorer=rapidfuzz.distance.Levenshtein.distance, score_cutoff=100
+        target, candidates, scorer=rapidfuzz.distance.Levenshtein.distance, score_cutoff=100
     )
-    return keys[values.index(result[0])] if result else None
+    return result[2] if result else None
 
 
 def closest_to(value, choices):
@@ -21,7 +27,7 @@ def closest_to(value, choices):
 def find_number(s: str, idx: int = 0) -> float | None:
     s = remove_text_after_first_keyword(s, Dataloader().filter_after_keyword)
     s = s.replace(r",", "")  # remove commas because of large numbers having a comma seperator
-    matches = re.findall(r"[+-]?(\d+\.\d+|\.\d+|\d+\.?|\d+)\%?", s)
+    matches = _FIND_NUMBER_REGEX.findall(s)
     number = (
         (matches[1] if len(matches) > 1 else None)
         if "up to a 5%" in s
@@ -30,7 +36,7 @@ def find_number(s: str, idx: int = 0) -> float | None:
         else None
     )
     if number is not None:
-        number = re.sub(r"[+%]", "", number)
+        number = number.replace("+", "").replace("%", "")
         return float(number)
     return None
 
@@ -38,22 +44,24 @@ def find_number(s: str, idx: int = 0) -> float | None:
 def remove_text_after_first_keyword(text: str, keywords: list[str]) -> str:
     start_pos = None
     for keyword in keywords:
-        match = re.search(re.escape(keyword), text)
-        if match and (start_pos is None or start_pos > match.start()):
-            start_pos = match.start() if start_pos is None or start_pos > match.start() else start_pos
+        # The keywords are plain strings, so a substring search beats building a regex per keyword
+        pos = text.find(keyword)
+        if pos != -1 and (start_pos is None or pos < start_pos):
+            start_pos = pos
     if start_pos is not None:
         return text[:start_pos]
     return text
 
 
 def clean_str(s: str) -> str:
-    cleaned_str = re.sub(r"(\d)[, ]+(\d)", r"\1\2", s)  # Remove , between numbers (large number seperator)
-    cleaned_str = re.sub(r"(\+)?\d+(\.\d+)?%?", "", cleaned_str)  # Remove numbers and trailing % or preceding +
+    cleaned_str = _NUMBER_SEPARATOR_REGEX.sub(r"\1\2", s)  # Remove , between numbers (large number seperator)
+    cleaned_str = _NUMBER_REGEX.sub("", cleaned_str)  # Remove numbers and trailing % or preceding +
     cleaned_str = cleaned_str.replace("[x]", "")  # Remove all [x]
     cleaned_str = cleaned_str.replace("durability:", "")
-    cleaned_str = re.sub(r"[\[\]+\-:%\'#]", "", cleaned_str)  # Remove [ and ] and leftover +, -, %, :, '
-    cleaned_str = remove_text_after_first_keyword(cleaned_str, Dataloader().filter_after_keyword)
-    for s in Dataloader().filter_words:
+    cleaned_str = _SPECIAL_CHARS_REGEX.sub("", cleaned_str)  # Remove [ and ] and leftover +, -, %, :, '
+    dataloader = Dataloader()
+    cleaned_str = remove_text_after_first_keyword(cleaned_str, dataloader.filter_after_keyword)
+    for s in dataloader.filter_words:
         cleaned_str = cleaned_str.replace(s, "")
     if "(" in cleaned_str:
         cleaned_str = cleaned_str[: cleaned_str.rfind("(")]
@@ -248,8 +248,18 @@ def test_parse_d4builds_paragon_boards_produces_valid_typed_payload_input() -> N
             return "transform: rotate(90deg);" if name == "style" else ""
 
     class _FakeDriver:
-        def execute_script(self, script, board_elem):
-            return board_elem._attrs
+        def execute_script(self, script, *args):
+            if "document.getElementsByClassName" in script:
+                return [{
+                    "name": "Starting Board",
+                    "glyph": "Glyph Name",
+                    "style": "transform: rotate(90deg);",
+                    "boardId": "Paragon_Barb_00",
+                    "tiles": [[2, 10]],
+                }]
+            if "paragon__board__tile" in script:
+                return [[2, 10]]
+            return args[0]._attrs
 
         def find_elements(self, by, value):
             if value == "paragon__board":